@@ -2,45 +2,155 @@
 
 import sys
 import os
+import functools
+import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 import typer
-import questionary
-from questionary import Style
-from rich.console import Console
-from rich.theme import Theme
 
 RUBY_RED = "#F70018"
 
-custom_theme = Theme({
+GITIGNORE = """# Python-generated files
+__pycache__/
+*.py[oc]
+build/
+dist/
+wheels/
+*.egg-info
+
+# Virtual environments
+.venv
+
+# Tool caches
+.ruff_cache
+.mypy_cache
+"""
+
+MAIN_PY_TEMPLATES = {
+    "Vanilla": """def main() -> None:
+    print("Hello from {name}!")
+
+if __name__ == "__main__":
+    main()
+""",
+    "FastAPI": """from fastapi import FastAPI
+
+app = FastAPI()
+
+@app.get("/")
+def main():
+    return {{"Hello": "World", "Framework": "FastAPI"}}
+""",
+    "Flask": """from flask import Flask
+
+app = Flask(__name__)
+
+@app.route("/")
+def main():
+    return {{"Hello": "World", "Framework": "Flask"}}
+""",
+    "Streamlit": """import streamlit as st
+
+st.write("Welcome to your new Streamlit app!")
+""",
+    "Typer": """import typer
+
+app = typer.Typer()
+
+@app.command()
+def main(name: str):
+    print("Welcome to your new Typer app!")
+
+if __name__ == "__main__":
+    main()
+""",
+    "NiceGUI": """from nicegui import ui
+
+def main():
+    ui.label('Hello from {name}!')
+    ui.button('Click me!', on_click=lambda: ui.notify('You clicked me!'))
+    ui.run(reload=True)
+
+if __name__ in {{"__main__", "__mp_main__"}}:
+    main()
+""",
+}
+
+DEV_CMDS = {
+    "Vanilla": "python -m watchfiles 'python main.py' .",
+    "FastAPI": "python -m uvicorn main:app --reload",
+    "Flask": "python -m flask --app main run --debug",
+    "Streamlit": "python -m streamlit run main.py",
+    "Typer": "python main.py --help",
+    "NiceGUI": "python main.py",
+}
+
+# framework -> (app deps, dev deps)
+FRAMEWORK_DEPS = {
+    "Vanilla": ([], ["watchfiles"]),
+    "FastAPI": (["fastapi", "uvicorn[standard]"], []),
+    "Flask": (["flask"], []),
+    "Streamlit": (["streamlit"], []),
+    "Typer": (["typer"], []),
+    "NiceGUI": (["nicegui"], []),
+}
+
+# Raw style specs; the objects are built in create(). Deferring questionary
+# keeps prompt_toolkit off the `--help` path. typer loads rich for its own
+# help output anyway, so deferring the rich imports saves little.
+THEME_STYLES = {
     "ruby": f"bold {RUBY_RED}",
     "dim": "dim",
     "success": "green",
     "error": "bold red",
-})
+}
 
-prompt_style = Style([
+PROMPT_STYLES = [
     ('qmark', f'fg:{RUBY_RED} bold'),       
     ('question', 'bold'),                   
     ('answer', f'fg:{RUBY_RED} bold'),      
     ('pointer', f'fg:{RUBY_RED} bold'),    
     ('highlighted', f'fg:{RUBY_RED} bold noreverse'),
     ('instruction', 'fg:gray'),           
-])
+]
 
 app = typer.Typer(help="Scaffold a strictly typed Python project.", add_completion=False)
-console = Console(theme=custom_theme)
 
 def get_system_python() -> str:
     return f"{sys.version_info.major}.{sys.version_info.minor}"
 
-def generate_toml(name: str, linter: str, type_checker: str, py_ver: str, framework: str) -> str:
-    config = ""
+def validate_project_name(name: str) -> Union[bool, str]:
+    target = name or "my-py-app"
+    if Path(target).exists():
+        return f"Directory '{target}' already exists."
+    return True
+
+@functools.cache
+def find_executable(name: str) -> Optional[str]:
+    return shutil.which(name)
+
+def toml_array(items: list[str]) -> str:
+    if not items:
+        return "[]"
+
+    lines = "".join(f'    "{item}",\n' for item in items)
+    return f"[\n{lines}]"
+
+def generate_toml(
+    name: str,
+    linter: str,
+    type_checker: str,
+    py_ver: str,
+    framework: str,
+    deps: list[str],
+    dev_deps: list[str],
+) -> str:
+    config: list[str] = []
     ruff_ver = f"py{py_ver.replace('.', '')}"
 
     if "Ruff" in linter:
-        config += f"""
+        config.append(f"""
 [tool.ruff]
 line-length = 88
 target-version = "{ruff_ver}"
@@ -51,54 +161,39 @@ fixable = ["ALL"]
 
 [tool.ruff.format]
 quote-style = "double"
-"""
+""")
 
     if "Ty" in type_checker:
-        config += """
+        config.append("""
 [tool.ty]
 # Ty defaults
-"""
+""")
 
     elif "Mypy" in type_checker:
-        config += """
+        config.append("""
 [tool.mypy]
 strict = true
 ignore_missing_imports = true
 disallow_untyped_defs = true
-"""
+""")
     
-    dev_cmd = ""
-
-    if framework == "Vanilla":
-        dev_cmd = "python -m watchfiles 'python main.py' ."
+    dev_cmd = DEV_CMDS.get(framework, "")
 
-    elif framework == "FastAPI":  
-        dev_cmd = "python -m uvicorn main:app --reload"
-
-    elif framework == "Flask":
-        dev_cmd = "python -m flask --app main run --debug"
-
-    elif framework == "Streamlit":
-        dev_cmd = "python -m streamlit run main.py"
-
-    elif framework == "Typer":
-        dev_cmd = "python main.py --help"
-
-    elif framework == "NiceGUI":
-        dev_cmd = "python main.py"
-
-    config += f"""
+    config.append(f"""
 [tool.poe.tasks]
 dev = "{dev_cmd}"
-"""
+""")
 
-    return f"""[project]
+    header = f"""[project]
 name = "{name}"
 version = "0.1.0"
 description = "Project generated with create-py-app"
 readme = "README.md"
 requires-python = ">={py_ver}"
-dependencies = []
+dependencies = {toml_array(deps)}
+
+[dependency-groups]
+dev = {toml_array(dev_deps)}
 
 [build-system]
 requires = ["hatchling"]
@@ -107,149 +202,112 @@ build-backend = "hatchling.build"
 [tool.hatch.build.targets.wheel]
 packages = ["."]
 
-{config}
-"""
-
-def generate_main_py(name: str, framework: str) -> str:
-    if framework == "Vanilla":
-        return f"""def main() -> None:
-    print("Hello from {name}!")
-
-if __name__ == "__main__":
-    main()
-"""
-    
-    elif framework == "FastAPI":
-        return """from fastapi import FastAPI
-
-app = FastAPI()
-
-@app.get("/")
-def main():
-    return {"Hello": "World", "Framework": "FastAPI"}
-"""
-
-    elif framework == "Flask":
-        return """from flask import Flask
-
-app = Flask(__name__)
-
-@app.route("/")
-def main():
-    return {"Hello": "World", "Framework": "Flask"}
-"""
-
-    elif framework == "Streamlit":
-        return """import streamlit as st
-
-st.write("Welcome to your new Streamlit app!")
-"""
-
-    elif framework == "Typer":
-        return f"""import typer
-
-app = typer.Typer()
-
-@app.command()
-def main(name: str):
-    print("Welcome to your new Typer app!")
-
-if __name__ == "__main__":
-    main()
 """
-    
-    elif framework == "NiceGUI":
-        return f"""from nicegui import ui
 
-def main():
-    ui.label('Hello from {name}!')
-    ui.button('Click me!', on_click=lambda: ui.notify('You clicked me!'))
-    ui.run(reload=True)
+    return "".join([header, *config, "\n"])
 
-if __name__ in {"__main__", "__mp_main__"}:
-    main()
-"""
-    return ""
+def generate_main_py(name: str, framework: str) -> str:
+    return MAIN_PY_TEMPLATES.get(framework, "").format(name=name)
 
 @app.command()
 def create(
     project_name: Optional[str] = typer.Argument(None, help="The name of the project directory"),
     git: bool = typer.Option(True, help="Initialize a git repository"),
 ):
+    import questionary
+    from questionary import Style
+    from rich.console import Console
+    from rich.markup import escape
+    from rich.theme import Theme
+
+    console = Console(theme=Theme(THEME_STYLES))
+    prompt_style = Style(PROMPT_STYLES)
+
     detected_ver = get_system_python()
     
     console.print(f"\n[ruby]Create Py App[/]")
     console.print(f"[dim]Detected System Python: {detected_ver}[/]\n")
 
+    # Check for required tools before asking anything. The resolved paths are
+    # reused for every call so each one execs directly.
+    uv_bin = find_executable("uv")
+    if uv_bin is None:
+        console.print("[error]uv was not found on PATH.[/]")
+        raise typer.Exit(code=1)
+
+    # git is optional, so a missing binary only turns repository setup off.
+    git_bin = find_executable("git")
+    if git and git_bin is None:
+        console.print("[dim]git was not found on PATH; skipping repository setup.[/]\n")
+        git = False
+
+    # Fail fast on taken names; the directory claim at create time is still
+    # the race-proof check.
+    if project_name and Path(project_name).exists():
+        console.print(f"[error]Directory '{project_name}' already exists.[/]")
+        raise typer.Exit(code=1)
+
+    questions = {}
+
     if not project_name:
-        project_name = questionary.text(
+        questions["project_name"] = questionary.text(
             "Project name",
             instruction="(default: my-py-app)", 
             qmark="◇",
+            validate=validate_project_name,
             style=prompt_style
-        ).ask()
-        
-        if project_name is None: raise typer.Exit()
-        if not project_name: project_name = "my-py-app"
-
-    path = Path(project_name)
-
-    if path.exists():
-        console.print(f"\n[error]Directory '{project_name}' already exists.[/]")
-        raise typer.Exit(code=1)
+        )
 
-    framework = questionary.select(
+    questions["framework"] = questionary.select(
         "Select a framework",
         choices=["Vanilla", "FastAPI", "Flask", "Streamlit", "Typer", "NiceGUI"],
         qmark="◇",
         pointer="❯",
         style=prompt_style,
-    ).ask()
-
-    if framework is None: raise typer.Exit()
+    )
 
-    linter_choice = questionary.select(
+    questions["linter_choice"] = questionary.select(
         "Select a linter",
         choices=["Ruff (Fast, Recommended)", "None"],
         qmark="◇",
         pointer="❯",
         style=prompt_style,
-    ).ask()
-
-    if linter_choice is None: raise typer.Exit()
+    )
 
-    type_choice = questionary.select(
+    questions["type_choice"] = questionary.select(
         "Select a type checker",
         choices=["Ty (Astral - Fast)", "Mypy (Standard)", "None"],
         qmark="◇",
         pointer="❯",
         style=prompt_style,
-    ).ask()
-
-    if type_choice is None: raise typer.Exit()
+    )
 
-    should_install = questionary.confirm(
+    questions["should_install"] = questionary.confirm(
         "Install dependencies now?",
         default=True,
         qmark="◇",
         style=prompt_style
-    ).ask()
+    )
+
+    # A cancelled form returns an empty dict.
+    answers = questionary.form(**questions).ask()
+    if not answers: raise typer.Exit()
 
-    if should_install is None: raise typer.Exit()
+    project_name = project_name or answers["project_name"] or "my-py-app"
+    framework = answers["framework"]
+    linter_choice = answers["linter_choice"]
+    type_choice = answers["type_choice"]
+    should_install = answers["should_install"]
+
+    path = Path(project_name)
 
     console.print(f"Scaffolding project in [bold white]{project_name}[/]...")
 
-    path.mkdir()
-    
     subprocess_env = os.environ.copy()
     subprocess_env.pop("VIRTUAL_ENV", None)
 
-    subprocess.run(["uv", "init", "--python", detected_ver, "--quiet"], cwd=path, env=subprocess_env, check=True)
-
-    if (path / "hello.py").exists():
-        (path / "hello.py").unlink()
-
-    (path / "main.py").write_text(generate_main_py(project_name, framework))
+    # Shared by every child process.
+    proc_opts = {"cwd": path, "env": subprocess_env}
 
     deps = []
     dev_deps = ["poethepoet"] 
@@ -258,54 +316,116 @@ def create(
     if "Ty" in type_choice: dev_deps.append("ty")
     if "Mypy" in type_choice: dev_deps.append("mypy")
 
-    if framework == "Vanilla":
-        dev_deps.append("watchfiles")
-
-    elif framework == "FastAPI":
-        deps.extend(["fastapi", "uvicorn[standard]"])
-
-    elif framework == "Flask":
-        deps.append("flask")
-
-    elif framework == "Streamlit":
-        deps.append("streamlit")
-
-    elif framework == "Typer":
-        deps.append("typer")
-
-    elif framework == "NiceGUI":
-        deps.append("nicegui")
-
-    (path / "pyproject.toml").write_text(
-        generate_toml(project_name, linter_choice, type_choice, detected_ver, framework)
-    )
-
-    if should_install:
-        if deps:
-            console.print(f"    [dim]Installing app deps: {', '.join(deps)}...[/]")
-            subprocess.run(["uv", "add"] + deps + ["--quiet"], cwd=path, env=subprocess_env)
-        
-        if dev_deps:
-            console.print(f"    [dim]Installing dev deps: {', '.join(dev_deps)}...[/]")
-            subprocess.run(["uv", "add", "--dev"] + dev_deps + ["--quiet"], cwd=path, env=subprocess_env)
-
-        console.print(f"    [dim]Installing project...[/]")
-        subprocess.run(["uv", "sync", "--quiet"], cwd=path, env=subprocess_env)
-
-        if "Ruff" in linter_choice:
-            console.print("    [dim]Running initial format...[/]")
-            subprocess.run(["uv", "run", "ruff", "format", ".", "--quiet"], cwd=path, env=subprocess_env)
+    framework_deps, framework_dev_deps = FRAMEWORK_DEPS[framework]
+    deps.extend(framework_deps)
+    dev_deps.extend(framework_dev_deps)
 
+    # Claim the target first so an existing directory, even an empty one, is
+    # rejected atomically.
+    try:
+        path.mkdir()
+    except FileExistsError:
+        console.print(f"\n[error]Directory '{project_name}' already exists.[/]")
+        raise typer.Exit(code=1) from None
+
+    # From here on the directory is ours. If a step fails or the user hits
+    # Ctrl+C, stop any running children and remove the half-built project.
+    git_init = None
+    children = []
+
+    try:
+        (path / "pyproject.toml").write_text(
+            generate_toml(
+                project_name,
+                linter_choice,
+                type_choice,
+                detected_ver,
+                framework,
+                deps,
+                dev_deps,
+            )
+        )
+        (path / "main.py").write_text(generate_main_py(project_name, framework))
+        (path / ".python-version").write_text(f"{detected_ver}\n")
+        (path / "README.md").write_text(f"# {project_name}\n")
+        (path / ".gitignore").write_text(GITIGNORE)
+
+        # `git init` only needs the directory, so start it now and let it run in
+        # the background while uv installs. Like the `uv init` this replaced, it
+        # runs whether or not dependencies are installed.
         if git:
-            console.print("    [dim]Initializing Git...[/]")
-            subprocess.run(["git", "init", "-q"], cwd=path, env=subprocess_env)
-            with (path / ".gitignore").open("a") as f:
-                f.write(".ruff_cache\n.mypy_cache\n__pycache__\n")
-            subprocess.run(["git", "add", "."], cwd=path, env=subprocess_env)
-            subprocess.run(["git", "commit", "-q", "-m", "Init"], cwd=path, env=subprocess_env)
-
-    else:
-        console.print("[dim]  Skipping install.[/]")
+            git_init = subprocess.Popen([git_bin, "init", "-q"], **proc_opts)
+            children.append(git_init)
+
+        if should_install:
+            if deps:
+                console.print(f"    [dim]App deps: {escape(', '.join(deps))}[/]")
+
+            console.print(f"    [dim]Dev deps: {escape(', '.join(dev_deps))}[/]")
+            # Capture uv's output through a pipe so the spinner keeps animating
+            # while it resolves and installs.
+            with console.status("[dim]Installing project...[/]"):
+                sync = subprocess.Popen(
+                    [uv_bin, "sync", "--quiet"],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    **proc_opts,
+                )
+                children.append(sync)
+                sync_output, _ = sync.communicate()
+
+            # uv's output is printed verbatim: it often contains `pkg[extra]`,
+            # which Rich would otherwise read as markup.
+            if sync.returncode != 0:
+                console.print("\n[error]uv sync failed:[/]")
+                console.print(sync_output, markup=False, end="")
+                raise typer.Exit(code=1)
+
+            if sync_output:
+                console.print(sync_output, markup=False, end="")
+
+            console.print("    [dim]Installed project.[/]")
+
+            if "Ruff" in linter_choice:
+                console.print("    [dim]Running initial format...[/]")
+                # Call the synced venv's ruff directly; `uv run` would add a second
+                # process start. The path is absolute because cwd differs from ours.
+                # Fall back to `uv run` when the venv lives elsewhere, e.g. under
+                # UV_PROJECT_ENVIRONMENT.
+                venv = path.resolve() / ".venv"
+                if os.name == "nt":
+                    ruff_bin = venv / "Scripts" / "ruff.exe"
+                else:
+                    ruff_bin = venv / "bin" / "ruff"
+
+                if ruff_bin.exists():
+                    ruff_cmd = [str(ruff_bin)]
+                else:
+                    ruff_cmd = [uv_bin, "run", "ruff"]
+
+                subprocess.run(ruff_cmd + ["format", ".", "--quiet"], **proc_opts)
+
+            if git_init is not None:
+                console.print("    [dim]Initializing Git...[/]")
+                git_init.wait()
+                subprocess.run([git_bin, "add", "."], **proc_opts)
+                subprocess.run([git_bin, "commit", "-q", "-m", "Init"], **proc_opts)
+
+        else:
+            console.print("[dim]  Skipping install.[/]")
+
+            if git_init is not None:
+                git_init.wait()
+    except BaseException:
+        for child in children:
+            if child.poll() is None:
+                child.kill()
+                child.wait()
+
+        shutil.rmtree(path, ignore_errors=True)
+        console.print(f"[dim]Removed incomplete project '{project_name}'.[/]")
+        raise
 
     console.print(f"\n[ruby]Done! Now run:[/]")
     console.print(f"  cd {project_name}")